@@ -1,4 +1,4 @@
-import React, { useState } from 'react';
+import React, { useState, useEffect, useRef } from 'react';
 import { 
   CheckCircle, 
   XCircle, 
@@ -14,174 +14,338 @@ import {
   Database
 } from 'lucide-react';
 
-const App = () => {
-  const [inputText, setInputText] = useState('');
-  const [results, setResults] = useState([]);
-  const [isChecking, setIsChecking] = useState(false);
-  const [progress, setProgress] = useState(0);
+// API 响应缓存：保留 30 天，最多 500 条
+const CACHE_STORAGE_KEY = 'refcheck-cache-v1';
+const CACHE_TTL_MS = 30 * 24 * 60 * 60 * 1000;
+const CACHE_MAX_ENTRIES = 500;
 
-  // 清理引用文本
-  const cleanCitation = (text) => {
-    // 移除 [1], 1., (1) 等常见序号
-    return text.replace(/^\[\d+\]\s*/, '')
-               .replace(/^\d+\.\s*/, '')
-               .replace(/^\(\d+\)\s*/, '')
-               .trim();
-  };
-
-  /**
-   * 改进的相似度检查算法：关键词覆盖率
-   * @param {string} userQuery - 用户输入的整行引用
-   * @param {string} apiTitle - API 返回的标准标题
-   */
-  const checkSimilarity = (userQuery, apiTitle) => {
-    if (!apiTitle || !userQuery) return false;
-
-    // 1. 预处理：转小写，移除标点，仅保留字母数字和中文
-    const normalize = (str) => str.toLowerCase().replace(/[^\w\u4e00-\u9fa5\s]/g, ' ');
-    
-    const normQuery = normalize(userQuery);
-    const normTitle = normalize(apiTitle);
-
-    // 2. 提取标题中的有效关键词（忽略小于3个字符的短词，除非是中文）
-    const titleWords = normTitle.split(/\s+/).filter(w => 
-      (w.length > 2 && /^[a-zA-Z0-9]+$/.test(w)) || /[\u4e00-\u9fa5]/.test(w)
-    );
+/**
+ * LRU 缓存，写入 localStorage 持久化，条目带过期时间
+ * @param {string} storageKey - localStorage 键名
+ * @param {{ttl: number, maxEntries: number}} options
+ */
+const createPersistentCache = (storageKey, { ttl, maxEntries }) => {
+  const entries = new Map();
+  let persistTimer = null;
 
-    if (titleWords.length === 0) return false;
-
-    // 3. 检查标题关键词在用户查询中出现的比例
-    let matchCount = 0;
-    titleWords.forEach(word => {
-      if (normQuery.includes(word)) {
-        matchCount++;
-      }
+  try {
+    const now = Date.now();
+    JSON.parse(localStorage.getItem(storageKey) || '[]').forEach(([key, entry]) => {
+      if (entry.expires > now) entries.set(key, entry);
     });
+  } catch (e) {
+    // localStorage 不可用或数据损坏时仅使用内存缓存
+  }
 
-    const coverage = matchCount / titleWords.length;
-
-    // 4. 判定标准：
-    // - 如果关键词覆盖率超过 60%，视为匹配
-    // - 或者如果标题本身就是查询的子串（短标题情况）
-    return coverage > 0.6 || normQuery.includes(normTitle);
+  // 合并短时间内的多次写入
+  const persist = () => {
+    if (persistTimer) return;
+    persistTimer = setTimeout(() => {
+      persistTimer = null;
+      try {
+        localStorage.setItem(storageKey, JSON.stringify([...entries]));
+      } catch (e) {
+        // 存储已满或不可用，忽略
+      }
+    }, 500);
   };
 
-  // OpenAlex API
-  const checkOpenAlex = async (query) => {
-    try {
-      const res = await fetch(`https://api.openalex.org/works?search=${encodeURIComponent(query)}&per-page=1`);
-      if (!res.ok) throw new Error('API Error');
-      const data = await res.json();
-      if (data.results && data.results.length > 0) {
-        const item = data.results[0];
-        const isMatch = checkSimilarity(query, item.display_name);
-        return {
-          found: true,
-          match: isMatch,
-          title: item.display_name,
-          year: item.publication_year,
-          url: item.doi,
-          sourceName: 'OpenAlex'
-        };
+  return {
+    // Worker 命中缓存后回报，把条目移到最近使用的位置
+    touch(key) {
+      const entry = entries.get(key);
+      if (!entry) return;
+      entries.delete(key);
+      if (entry.expires > Date.now()) entries.set(key, entry);
+      persist();
+    },
+    set(key, value) {
+      entries.delete(key);
+      entries.set(key, { value, expires: Date.now() + ttl });
+      while (entries.size > maxEntries) {
+        entries.delete(entries.keys().next().value);
+      }
+      persist();
+    },
+    // 未过期条目的快照，发送给 Worker 使用
+    snapshot() {
+      const now = Date.now();
+      const live = [];
+      entries.forEach((entry, key) => {
+        if (entry.expires > now) live.push([key, entry.value]);
+      });
+      return live;
+    },
+    clear() {
+      entries.clear();
+      clearTimeout(persistTimer);
+      persistTimer = null;
+      try {
+        localStorage.removeItem(storageKey);
+      } catch (e) {
+        // 忽略
       }
-      return { found: false, sourceName: 'OpenAlex' };
-    } catch (e) {
-      return { error: true, sourceName: 'OpenAlex' };
     }
   };
+};
 
-  // CrossRef API (替代 Semantic Scholar)
-  const checkCrossRef = async (query) => {
-    try {
-      // CrossRef 的 bibliographic 查询非常适合这种非结构化引用
-      const res = await fetch(`https://api.crossref.org/works?query.bibliographic=${encodeURIComponent(query)}&rows=1`);
-      if (!res.ok) throw new Error('API Error');
-      const data = await res.json();
-      
-      if (data.message && data.message.items && data.message.items.length > 0) {
-        const item = data.message.items[0];
-        // CrossRef 标题可能是数组
-        const title = item.title ? item.title[0] : '';
-        const year = item.created ? item.created['date-parts'][0][0] : '';
-        const isMatch = checkSimilarity(query, title);
-        
-        return {
-          found: true,
-          match: isMatch,
-          title: title,
-          year: year,
-          url: item.URL, // CrossRef 通常直接返回 DOI URL
-          sourceName: 'CrossRef'
-        };
-      }
-      return { found: false, sourceName: 'CrossRef' };
-    } catch (e) {
-      return { error: true, sourceName: 'CrossRef' };
-    }
+const responseCache = createPersistentCache(CACHE_STORAGE_KEY, {
+  ttl: CACHE_TTL_MS,
+  maxEntries: CACHE_MAX_ENTRIES
+});
+
+// 页面加载后即与 API 主机预先建立连接，首个请求省去 TCP/TLS 握手
+const API_ORIGINS = ['https://api.openalex.org', 'https://api.crossref.org'];
+
+const preconnectApiHosts = () => {
+  API_ORIGINS.forEach(origin => {
+    if (document.head.querySelector(`link[rel="preconnect"][href="${origin}"]`)) return;
+    const link = document.createElement('link');
+    link.rel = 'preconnect';
+    link.href = origin;
+    // API 请求是不带凭据的跨域请求，预连接也需匿名才能被复用
+    link.crossOrigin = 'anonymous';
+    document.head.appendChild(link);
+  });
+};
+
+const StatusBadge = ({ result }) => {
+  if (result.skipped) return <span className="text-xs text-slate-400 bg-slate-100 px-2 py-1 rounded">已跳过</span>;
+  if (result.error) return <span className="text-xs text-gray-400 bg-gray-100 px-2 py-1 rounded">连接失败</span>;
+  if (!result.found) return <span className="text-xs text-red-500 bg-red-50 px-2 py-1 rounded">未收录</span>;
+  if (result.match) return <span className="text-xs text-green-600 bg-green-100 px-2 py-1 rounded border border-green-200">已验证</span>;
+  return <span className="text-xs text-yellow-600 bg-yellow-100 px-2 py-1 rounded border border-yellow-200">疑似</span>;
+};
+
+// 单条核对结果；结果对象不变时跳过重新渲染
+const ResultRow = React.memo(({ item }) => (
+  <div className="border border-slate-200 rounded-lg p-4 hover:shadow-sm transition-shadow bg-white">
+    {/* Main Status Header */}
+    <div className="flex items-start gap-3 mb-3">
+      <div className="mt-1">
+        {item.status === 'verified' ? <CheckCircle className="w-5 h-5 text-green-500" /> :
+         item.status === 'suspicious' ? <AlertCircle className="w-5 h-5 text-yellow-500" /> :
+         <XCircle className="w-5 h-5 text-red-500" />}
+      </div>
+      <div className="flex-1">
+        <p className="text-sm text-slate-800 font-medium leading-relaxed">{item.original}</p>
+
+        {/* 状态提示文字 */}
+        {item.status === 'suspicious' && (
+          <p className="text-xs text-yellow-600 mt-1">
+            提示：数据库找到了相关文献，但标题关键词匹配度不足，请人工确认。
+          </p>
+        )}
+      </div>
+    </div>
+
+    {/* Sources Grid */}
+    <div className="ml-8 grid grid-cols-1 md:grid-cols-2 gap-3 mb-3">
+      {/* OpenAlex Result */}
+      <div className={`bg-slate-50 rounded p-2 text-xs border ${item.sources.openAlex.match ? 'border-green-200 bg-green-50' : 'border-slate-100'}`}>
+        <div className="flex justify-between items-center mb-1">
+          <span className="font-semibold text-slate-500">OpenAlex</span>
+          <StatusBadge result={item.sources.openAlex} />
+        </div>
+        {item.sources.openAlex.title && (
+          <div className="text-slate-600 truncate" title={item.sources.openAlex.title}>
+            {item.sources.openAlex.title}
+          </div>
+        )}
+      </div>
+
+      {/* CrossRef Result (原 Semantic Scholar) */}
+      <div className={`bg-slate-50 rounded p-2 text-xs border ${item.sources.crossRef.match ? 'border-green-200 bg-green-50' : 'border-slate-100'}`}>
+        <div className="flex justify-between items-center mb-1">
+          <span className="font-semibold text-slate-500">CrossRef (DOI)</span>
+          <StatusBadge result={item.sources.crossRef} />
+        </div>
+         {item.sources.crossRef.title && (
+          <div className="text-slate-600 truncate" title={item.sources.crossRef.title}>
+            {item.sources.crossRef.title}
+          </div>
+        )}
+      </div>
+    </div>
+
+    {/* External Check Tools */}
+    <div className="ml-8 pt-2 border-t border-slate-100 flex flex-wrap gap-2 items-center">
+      <span className="text-xs text-slate-400 mr-1">人工复核工具:</span>
+
+      <a 
+        href={`https://scholar.google.com/scholar?q=${encodeURIComponent(item.query)}`}
+        target="_blank"
+        rel="noreferrer"
+        className="flex items-center gap-1 text-xs px-2 py-1 rounded bg-blue-50 text-blue-700 hover:bg-blue-100 border border-blue-100 transition-colors"
+      >
+        <Search className="w-3 h-3" /> Google 学术
+      </a>
+
+      <a 
+        href={`https://xueshu.baidu.com/s?wd=${encodeURIComponent(item.query)}`}
+        target="_blank"
+        rel="noreferrer"
+        className="flex items-center gap-1 text-xs px-2 py-1 rounded bg-blue-50 text-blue-700 hover:bg-blue-100 border border-blue-100 transition-colors"
+      >
+        <Search className="w-3 h-3" /> 百度学术
+      </a>
+    </div>
+  </div>
+));
+
+// 结果列表单独记忆化，进度更新不会重建已有结果
+const ResultList = React.memo(({ results }) => (
+  <>
+    {results.map(item => (
+      <ResultRow key={`${item.index}:${item.query}`} item={item} />
+    ))}
+  </>
+));
+
+// 核对按钮独立成组件，进度变化只影响这一小块
+const ProgressButton = ({ isChecking, progress, disabled, onClick }) => (
+  <button
+    onClick={onClick}
+    disabled={disabled}
+    className={`w-full py-3 px-4 rounded-lg flex items-center justify-center gap-2 font-bold text-white transition-all shadow-md ${
+      isChecking ? 'bg-indigo-400 hover:bg-indigo-500' : 'bg-indigo-600 hover:bg-indigo-700 hover:shadow-lg'
+    }`}
+  >
+    {isChecking ? (
+      <>
+        <Loader2 className="w-4 h-4 animate-spin" />
+        多库检索中 {progress}%（点击停止）
+      </>
+    ) : (
+      <>
+        <Search className="w-4 h-4" />
+        开始全面核对
+      </>
+    )}
+  </button>
+);
+
+// 轻提示，显示 1.5 秒后自动消失，不阻塞页面
+const TOAST_DURATION_MS = 1500;
+
+const Toast = ({ message }) => (
+  <div className="fixed bottom-6 left-1/2 -translate-x-1/2 z-20 bg-slate-800 text-white text-sm px-4 py-2 rounded-lg shadow-lg">
+    {message}
+  </div>
+);
+
+// 列式存储的状态编码，与结果对象的 status 对应
+const STATUS_CODES = { not_found: 0, suspicious: 1, verified: 2 };
+
+// 核对中的结果每 250ms 合并一次进列表，避免逐条触发渲染
+const RESULT_FLUSH_MS = 250;
+
+const App = () => {
+  const [inputText, setInputText] = useState('');
+  const [results, setResults] = useState([]);
+  const [isChecking, setIsChecking] = useState(false);
+  const [progress, setProgress] = useState(0);
+  const [fastMode, setFastMode] = useState(true);
+  const [toast, setToast] = useState(null);
+  const toastTimerRef = useRef(null);
+  const workerRef = useRef(null);
+  const pendingRef = useRef([]);
+  const flushTimerRef = useRef(null);
+  // 每次核对的编号，用于丢弃已取消核对迟到的消息
+  const runIdRef = useRef(0);
+  // 按输入顺序列式保存状态与原文，批量筛选时无需遍历结果对象
+  const columnsRef = useRef({ statuses: new Uint8Array(0), originals: [] });
+
+  // 核对任务在 Web Worker 中执行，网络请求、JSON 解析与相似度计算都不占用主线程
+  useEffect(() => {
+    preconnectApiHosts();
+    const worker = new Worker(new URL('./refcheck.worker.js', import.meta.url));
+    workerRef.current = worker;
+    return () => {
+      clearInterval(flushTimerRef.current);
+      clearTimeout(toastTimerRef.current);
+      worker.terminate();
+    };
+  }, []);
+
+  const showToast = (message) => {
+    clearTimeout(toastTimerRef.current);
+    setToast(message);
+    toastTimerRef.current = setTimeout(() => setToast(null), TOAST_DURATION_MS);
   };
 
-  const checkReferences = async () => {
+  // 把已完成的结果按原顺序并入列表
+  const flushPending = () => {
+    if (pendingRef.current.length === 0) return;
+    const batch = pendingRef.current.splice(0);
+    setResults(prev => prev.concat(batch).sort((a, b) => a.index - b.index));
+  };
+
+  const checkReferences = () => {
     if (!inputText.trim()) return;
 
     setIsChecking(true);
     setResults([]);
     setProgress(0);
 
-    const lines = inputText.split('\n').filter(line => line.trim() !== '');
-    const total = lines.length;
-    let processed = 0;
-    const newResults = [];
-
-    for (const line of lines) {
-      const query = cleanCitation(line);
-      
-      // 并行请求 OpenAlex 和 CrossRef
-      const [oaResult, crResult] = await Promise.all([
-        checkOpenAlex(query),
-        checkCrossRef(query)
-      ]);
-
-      // 综合判断状态
-      let status = 'not_found';
-      let message = '未找到匹配';
-      
-      // 只要有一个数据库判定为高度匹配(verified)，就算通过
-      if (oaResult.match || crResult.match) {
-        status = 'verified';
-        message = '验证通过';
-      } 
-      // 如果两个都找到了但都不匹配
-      else if (oaResult.found || crResult.found) {
-        status = 'suspicious';
-        message = '标题差异较大';
+    // 新的核对会让 Worker 中止上一次尚未完成的请求
+    const runId = ++runIdRef.current;
+
+    const worker = workerRef.current;
+
+    pendingRef.current = [];
+    clearInterval(flushTimerRef.current);
+    flushTimerRef.current = setInterval(flushPending, RESULT_FLUSH_MS);
+
+    worker.onmessage = ({ data }) => {
+      if (data.type === 'cache') {
+        // Worker 中新获取的响应写回持久缓存
+        responseCache.set(data.key, data.value);
+      } else if (data.type === 'touch') {
+        responseCache.touch(data.key);
+      } else if (data.runId !== runIdRef.current) {
+        return;
+      } else if (data.type === 'start') {
+        columnsRef.current = {
+          statuses: new Uint8Array(data.total),
+          originals: new Array(data.total)
+        };
+      } else if (data.type === 'result') {
+        const { statuses, originals } = columnsRef.current;
+        statuses[data.index] = STATUS_CODES[data.result.status];
+        originals[data.index] = data.result.original;
+        pendingRef.current.push({ ...data.result, index: data.index });
+        setProgress(Math.round((data.processed / data.total) * 100));
+      } else if (data.type === 'done') {
+        clearInterval(flushTimerRef.current);
+        flushPending();
+        setIsChecking(false);
       }
+    };
 
-      newResults.push({
-        original: line,
-        query: query,
-        status: status,
-        message: message,
-        sources: {
-          openAlex: oaResult,
-          crossRef: crResult // 更改为 CrossRef
-        }
-      });
+    worker.postMessage({ type: 'check', runId, text: inputText, fastMode, cache: responseCache.snapshot() });
+  };
 
-      processed++;
-      setProgress(Math.round((processed / total) * 100));
-      // 简单的速率限制
-      await new Promise(r => setTimeout(r, 200));
+  // 复制全部验证通过的原文
+  const copyVerified = () => {
+    const { statuses, originals } = columnsRef.current;
+    const verified = [];
+    for (let i = 0; i < statuses.length; i++) {
+      if (statuses[i] === STATUS_CODES.verified) verified.push(originals[i]);
     }
-
-    setResults(newResults);
-    setIsChecking(false);
+    navigator.clipboard.writeText(verified.join('\n')).then(
+      () => showToast(`已复制 ${verified.length} 条`),
+      () => showToast('复制失败')
+    );
   };
 
-  const StatusBadge = ({ result }) => {
-    if (result.error) return <span className="text-xs text-gray-400 bg-gray-100 px-2 py-1 rounded">连接失败</span>;
-    if (!result.found) return <span className="text-xs text-red-500 bg-red-50 px-2 py-1 rounded">未收录</span>;
-    if (result.match) return <span className="text-xs text-green-600 bg-green-100 px-2 py-1 rounded border border-green-200">已验证</span>;
-    return <span className="text-xs text-yellow-600 bg-yellow-100 px-2 py-1 rounded border border-yellow-200">疑似</span>;
+  // 停止核对：保留已完成的结果，其余请求立即中止
+  const cancelCheck = () => {
+    runIdRef.current++;
+    workerRef.current.postMessage({ type: 'cancel' });
+    clearInterval(flushTimerRef.current);
+    flushPending();
+    setIsChecking(false);
   };
 
   return (
@@ -222,28 +386,24 @@ const App = () => {
               />
 
               <div className="mt-4 pt-4 border-t border-slate-100">
-                <button
-                  onClick={checkReferences}
-                  disabled={isChecking || !inputText.trim()}
-                  className={`w-full py-3 px-4 rounded-lg flex items-center justify-center gap-2 font-bold text-white transition-all shadow-md ${
-                    isChecking ? 'bg-indigo-400 cursor-wait' : 'bg-indigo-600 hover:bg-indigo-700 hover:shadow-lg'
-                  }`}
-                >
-                  {isChecking ? (
-                    <>
-                      <Loader2 className="w-4 h-4 animate-spin" />
-                      多库检索中 {progress}%
-                    </>
-                  ) : (
-                    <>
-                      <Search className="w-4 h-4" />
-                      开始全面核对
-                    </>
-                  )}
-                </button>
+                <ProgressButton
+                  isChecking={isChecking}
+                  progress={progress}
+                  disabled={!isChecking && !inputText.trim()}
+                  onClick={isChecking ? cancelCheck : checkReferences}
+                />
                 <p className="text-xs text-center text-slate-400 mt-2">
                   双重校验：OpenAlex + CrossRef (DOI库)
                 </p>
+                <label className="mt-2 flex items-center justify-center gap-2 text-xs text-slate-500 cursor-pointer">
+                  <input
+                    type="checkbox"
+                    checked={fastMode}
+                    onChange={(e) => setFastMode(e.target.checked)}
+                    disabled={isChecking}
+                  />
+                  快速模式（OpenAlex 已验证时跳过 CrossRef）
+                </label>
               </div>
             </div>
           </div>
@@ -255,15 +415,22 @@ const App = () => {
                 <h3 className="font-semibold text-slate-700">核对报告</h3>
                 <div className="flex gap-2">
                   {results.length > 0 && !isChecking && (
+                    <button 
+                      onClick={copyVerified}
+                      className="text-xs bg-white border hover:bg-slate-50 px-3 py-1.5 rounded-md flex items-center gap-1"
+                    >
+                      <Copy className="w-3 h-3" /> 复制通过项
+                    </button>
+                  )}
+                  {!isChecking && (
                     <button 
                       onClick={() => {
-                        const valid = results.filter(r => r.status === 'verified').map(r => r.original).join('\n');
-                        navigator.clipboard.writeText(valid);
-                        alert('已复制');
+                        responseCache.clear();
+                        showToast('缓存已清除');
                       }}
                       className="text-xs bg-white border hover:bg-slate-50 px-3 py-1.5 rounded-md flex items-center gap-1"
                     >
-                      <Copy className="w-3 h-3" /> 复制通过项
+                      <Trash2 className="w-3 h-3" /> 清除缓存
                     </button>
                   )}
                 </div>
@@ -277,85 +444,14 @@ const App = () => {
                   </div>
                 )}
 
-                {results.map((item, index) => (
-                  <div key={index} className="border border-slate-200 rounded-lg p-4 hover:shadow-sm transition-shadow bg-white">
-                    {/* Main Status Header */}
-                    <div className="flex items-start gap-3 mb-3">
-                      <div className="mt-1">
-                        {item.status === 'verified' ? <CheckCircle className="w-5 h-5 text-green-500" /> :
-                         item.status === 'suspicious' ? <AlertCircle className="w-5 h-5 text-yellow-500" /> :
-                         <XCircle className="w-5 h-5 text-red-500" />}
-                      </div>
-                      <div className="flex-1">
-                        <p className="text-sm text-slate-800 font-medium leading-relaxed">{item.original}</p>
-                        
-                        {/* 状态提示文字 */}
-                        {item.status === 'suspicious' && (
-                          <p className="text-xs text-yellow-600 mt-1">
-                            提示：数据库找到了相关文献，但标题关键词匹配度不足，请人工确认。
-                          </p>
-                        )}
-                      </div>
-                    </div>
-
-                    {/* Sources Grid */}
-                    <div className="ml-8 grid grid-cols-1 md:grid-cols-2 gap-3 mb-3">
-                      {/* OpenAlex Result */}
-                      <div className={`bg-slate-50 rounded p-2 text-xs border ${item.sources.openAlex.match ? 'border-green-200 bg-green-50' : 'border-slate-100'}`}>
-                        <div className="flex justify-between items-center mb-1">
-                          <span className="font-semibold text-slate-500">OpenAlex</span>
-                          <StatusBadge result={item.sources.openAlex} />
-                        </div>
-                        {item.sources.openAlex.title && (
-                          <div className="text-slate-600 truncate" title={item.sources.openAlex.title}>
-                            {item.sources.openAlex.title}
-                          </div>
-                        )}
-                      </div>
-
-                      {/* CrossRef Result (原 Semantic Scholar) */}
-                      <div className={`bg-slate-50 rounded p-2 text-xs border ${item.sources.crossRef.match ? 'border-green-200 bg-green-50' : 'border-slate-100'}`}>
-                        <div className="flex justify-between items-center mb-1">
-                          <span className="font-semibold text-slate-500">CrossRef (DOI)</span>
-                          <StatusBadge result={item.sources.crossRef} />
-                        </div>
-                         {item.sources.crossRef.title && (
-                          <div className="text-slate-600 truncate" title={item.sources.crossRef.title}>
-                            {item.sources.crossRef.title}
-                          </div>
-                        )}
-                      </div>
-                    </div>
-
-                    {/* External Check Tools */}
-                    <div className="ml-8 pt-2 border-t border-slate-100 flex flex-wrap gap-2 items-center">
-                      <span className="text-xs text-slate-400 mr-1">人工复核工具:</span>
-                      
-                      <a 
-                        href={`https://scholar.google.com/scholar?q=${encodeURIComponent(item.query)}`}
-                        target="_blank"
-                        rel="noreferrer"
-                        className="flex items-center gap-1 text-xs px-2 py-1 rounded bg-blue-50 text-blue-700 hover:bg-blue-100 border border-blue-100 transition-colors"
-                      >
-                        <Search className="w-3 h-3" /> Google 学术
-                      </a>
-
-                      <a 
-                        href={`https://xueshu.baidu.com/s?wd=${encodeURIComponent(item.query)}`}
-                        target="_blank"
-                        rel="noreferrer"
-                        className="flex items-center gap-1 text-xs px-2 py-1 rounded bg-blue-50 text-blue-700 hover:bg-blue-100 border border-blue-100 transition-colors"
-                      >
-                        <Search className="w-3 h-3" /> 百度学术
-                      </a>
-                    </div>
-                  </div>
-                ))}
+                <ResultList results={results} />
               </div>
             </div>
           </div>
         </div>
       </main>
+
+      {toast && <Toast message={toast} />}
     </div>
   );
 };
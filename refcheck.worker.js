@@ -0,0 +1,471 @@
+// RefCheck Pro 核对 Worker：在主线程之外完成检索、解析与相似度判断
+
+// 只请求用到的字段，大幅缩小响应体
+const OPENALEX_FIELDS = 'display_name,publication_year,doi';
+const CROSSREF_FIELDS = 'title,URL,created';
+
+// 同时核对的引用行数（每行对两个 API 各发一个请求）
+const LINE_CONCURRENCY = 5;
+// 每个 API 主机允许的请求速率（次/秒）
+const REQUESTS_PER_SECOND = 8;
+
+// 礼貌池（polite pool）联系邮箱，OpenAlex 与 CrossRef 依据 mailto 参数分流
+const CONTACT_EMAIL = 'refcheck@example.com';
+
+/**
+ * 拼接 API 请求地址，统一附带 mailto 参数
+ * @param {string} base - 接口地址
+ * @param {Object<string, string|number>} params - 查询参数
+ */
+const buildApiUrl = (base, params) => {
+  const url = new URL(base);
+  Object.entries(params).forEach(([key, value]) => url.searchParams.set(key, value));
+  url.searchParams.set('mailto', CONTACT_EMAIL);
+  return url.toString();
+};
+
+// 等待 ms 毫秒；传入 signal 时，中止会立即以 AbortError 结束等待
+const sleep = (ms, signal) => new Promise((resolve, reject) => {
+  const abort = () => {
+    clearTimeout(timer);
+    reject(new DOMException('Aborted', 'AbortError'));
+  };
+  const timer = setTimeout(() => {
+    if (signal) signal.removeEventListener('abort', abort);
+    resolve();
+  }, ms);
+  if (!signal) return;
+  if (signal.aborted) abort();
+  else signal.addEventListener('abort', abort, { once: true });
+});
+
+// 限流（429）、服务不可用（503）和网络错误最多重试 3 次，指数退避并加 ±30% 抖动，单次退避不超过 10 秒
+const RETRY_OPTIONS = { retries: 3, baseDelay: 500, factor: 2, jitter: 0.3, maxDelay: 10000 };
+const RETRYABLE_STATUSES = new Set([429, 503]);
+
+// 解析 Retry-After 头（秒数或 HTTP 日期），返回毫秒；缺失或无法解析时返回 null
+const parseRetryAfter = (value) => {
+  if (!value) return null;
+  const seconds = Number(value);
+  if (!Number.isNaN(seconds)) return seconds * 1000;
+  const date = Date.parse(value);
+  return Number.isNaN(date) ? null : Math.max(0, date - Date.now());
+};
+
+/**
+ * 带重试的 fetch：只重试 429/503 和网络错误，有 Retry-After 时按其等待
+ * @param {string} url - 请求地址
+ * @param {RequestInit} init - fetch 选项
+ * @param {{take: Function}} limiter - 目标主机的限速器，每次尝试前领取令牌
+ */
+const retryFetch = async (url, init, limiter, options = RETRY_OPTIONS) => {
+  const { retries, baseDelay, factor, jitter, maxDelay } = options;
+  for (let attempt = 0; ; attempt++) {
+    let res = null;
+    try {
+      await limiter.take();
+      res = await fetch(url, init);
+    } catch (e) {
+      if (e.name === 'AbortError' || attempt >= retries) throw e;
+    }
+    if (res && (!RETRYABLE_STATUSES.has(res.status) || attempt >= retries)) return res;
+
+    const retryAfter = res ? parseRetryAfter(res.headers.get('Retry-After')) : null;
+    // 服务端要求的等待超过上限时不再重试，直接返回该响应
+    if (retryAfter !== null && retryAfter > maxDelay) return res;
+    const backoff = baseDelay * factor ** attempt * (1 + jitter * (Math.random() * 2 - 1));
+    await sleep(retryAfter ?? Math.min(backoff, maxDelay), init.signal);
+  }
+};
+
+/**
+ * 令牌桶限速器：按固定速率补充令牌，令牌不足时等待
+ * @param {number} ratePerSecond - 每秒允许的请求数
+ */
+const createRateLimiter = (ratePerSecond) => {
+  let tokens = ratePerSecond;
+  let last = Date.now();
+  let queue = Promise.resolve();
+
+  const acquire = async () => {
+    const now = Date.now();
+    tokens = Math.min(ratePerSecond, tokens + ((now - last) / 1000) * ratePerSecond);
+    last = now;
+    if (tokens < 1) {
+      await sleep(((1 - tokens) / ratePerSecond) * 1000);
+      tokens = 1;
+      last = Date.now();
+    }
+    tokens -= 1;
+  };
+
+  // 串行排队领取令牌，保证并发调用时计数正确
+  return { take: () => (queue = queue.then(acquire)) };
+};
+
+// 按主机分别限速
+const openAlexLimiter = createRateLimiter(REQUESTS_PER_SECOND);
+const crossRefLimiter = createRateLimiter(REQUESTS_PER_SECOND);
+
+/**
+ * 有界并发执行任务，结果按任务原顺序返回
+ * @param {Array<() => Promise>} tasks - 任务列表
+ * @param {number} concurrency - 最大并发数
+ */
+const runPool = async (tasks, concurrency) => {
+  const results = new Array(tasks.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < tasks.length) {
+      const i = next++;
+      results[i] = await tasks[i]();
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(concurrency, tasks.length) }, worker));
+  return results;
+};
+
+// 预编译的正则，避免在热路径上重复创建
+const PUNCTUATION_RE = /[^\w\u4e00-\u9fa5\s]/g;
+const WHITESPACE_RUN_RE = /\s+/g;
+const PLURAL_IES_RE = /ies$/;
+const PLURAL_S_RE = /([^s])s$/;
+const ISATION_RE = /isation$/;
+// 一行一条引用：跳过空行，去掉行首 [1]、(1)、1. 等序号与首尾空白，捕获正文；
+// 行首空白与序号经先行断言整体吞掉、不会回溯成正文，只有序号的行因此被跳过
+const CITATION_LINE_RE = /^(?=([^\S\n]*(?:\[\d+\]|\(\d+\)|\d+\.)?[^\S\n]*))\1(.*\S)[^\S\n]*$/gm;
+
+// 预处理：转小写，移除标点，仅保留字母数字和中文
+const normalizeText = (str) => str.toLowerCase().replace(PUNCTUATION_RE, ' ');
+
+// 缓存键：规范化后合并空白，空格或标点的改动仍能命中
+const normalizeKey = (str) => normalizeText(str).trim().replace(WHITESPACE_RUN_RE, ' ');
+
+// 响应缓存：每次核对前由主线程同步 localStorage 中的条目，新结果和命中都回传主线程
+let cache = new Map();
+
+// 进行中的请求，相同键的并发调用共享同一个 Promise
+const inFlight = new Map();
+
+/**
+ * 带缓存的异步函数包装：命中直接返回，相同请求进行中则复用，否则调用并写入缓存
+ * @param {Function} fn - 被包装的异步函数
+ * @param {{keyFn: Function, shouldCache: Function}} options
+ */
+const memoize = (fn, { keyFn, shouldCache }) => (...args) => {
+  const key = keyFn(...args);
+  const cached = cache.get(key);
+  if (cached !== undefined) {
+    // 通知主线程更新 LRU 顺序
+    self.postMessage({ type: 'touch', key });
+    return Promise.resolve(cached);
+  }
+  if (inFlight.has(key)) return inFlight.get(key);
+
+  const pending = fn(...args)
+    .then(value => {
+      if (shouldCache(value)) {
+        cache.set(key, value);
+        self.postMessage({ type: 'cache', key, value });
+      }
+      return value;
+    })
+    .finally(() => {
+      // 核对重启后同一键可能已被新请求占用，只删除自己的条目
+      if (inFlight.get(key) === pending) inFlight.delete(key);
+    });
+  inFlight.set(key, pending);
+  return pending;
+};
+
+// 连接失败的结果不缓存，下次重新请求
+const isCacheable = (result) => !result.error;
+
+// 标题相似度阈值：字符 3-gram Jaccard 不低于 0.55 视为匹配
+const SIMILARITY_THRESHOLD = 0.55;
+// 少于 4 个词的短标题 3-gram 太少，Jaccard 容易把拼写相近的不同标题判为匹配，改为逐词比较；
+// 只允许一个不少于 10 个字符的词存在 20% 以内的拼写差异
+const SHORT_TITLE_WORDS = 4;
+const EDIT_DISTANCE_RATIO = 0.2;
+const MIN_EDIT_WORD_LENGTH = 10;
+
+// 简易词干：去掉复数，统一英式 -isation 与美式 -ization
+const stemWord = (word) => {
+  if (word.length <= 3) return word;
+  let stem = word.replace(PLURAL_IES_RE, 'y');
+  if (stem === word) stem = word.replace(PLURAL_S_RE, '$1');
+  return stem.replace(ISATION_RE, 'ization');
+};
+
+// 字符 3-gram 集合，首尾补空格以保留词边界
+const charTrigrams = (text) => {
+  const grams = new Set();
+  const padded = ` ${text} `;
+  for (let i = 0; i + 3 <= padded.length; i++) {
+    grams.add(padded.slice(i, i + 3));
+  }
+  return grams;
+};
+
+const jaccard = (a, b) => {
+  let shared = 0;
+  for (const gram of a) {
+    if (b.has(gram)) shared++;
+  }
+  return shared / (a.size + b.size - shared);
+};
+
+/**
+ * 有上限的编辑距离：一旦整行都超过 maxDist 即提前返回（Ukkonen 截断）
+ * @returns {number} 编辑距离，超过上限时返回 maxDist + 1
+ */
+const boundedLevenshtein = (a, b, maxDist) => {
+  if (Math.abs(a.length - b.length) > maxDist) return maxDist + 1;
+  let prev = Array.from({ length: b.length + 1 }, (_, j) => j);
+  for (let i = 1; i <= a.length; i++) {
+    const curr = [i];
+    let rowMin = i;
+    for (let j = 1; j <= b.length; j++) {
+      const cost = a[i - 1] === b[j - 1] ? 0 : 1;
+      curr[j] = Math.min(prev[j] + 1, curr[j - 1] + 1, prev[j - 1] + cost);
+      if (curr[j] < rowMin) rowMin = curr[j];
+    }
+    if (rowMin > maxDist) return maxDist + 1;
+    prev = curr;
+  }
+  return prev[b.length];
+};
+
+// 短标题逐词比较：词干须逐一相同，至多一个长词允许少量拼写差异
+const matchesShortTitle = (titleTokens, windowTokens) => {
+  if (windowTokens.length !== titleTokens.length) return false;
+  let typos = 0;
+  for (let i = 0; i < titleTokens.length; i++) {
+    const word = titleTokens[i];
+    if (word === windowTokens[i]) continue;
+    if (++typos > 1 || word.length < MIN_EDIT_WORD_LENGTH) return false;
+    const maxDist = Math.floor(word.length * EDIT_DISTANCE_RATIO);
+    if (boundedLevenshtein(word, windowTokens[i], maxDist) > maxDist) return false;
+  }
+  return true;
+};
+
+/**
+ * 标题相似度检查：词干化后的字符 3-gram Jaccard，短标题逐词比较
+ * @param {string} userQuery - 用户输入的整行引用
+ * @param {string} apiTitle - API 返回的标准标题
+ */
+const checkSimilarity = (userQuery, apiTitle) => {
+  if (!apiTitle || !userQuery) return false;
+
+  // 1. 预处理：转小写，移除标点，合并空白
+  const normQuery = normalizeKey(userQuery);
+  const normTitle = normalizeKey(apiTitle);
+  if (!normTitle) return false;
+
+  // 2. 标题本身就是查询的子串（短标题情况）
+  if (normQuery.includes(normTitle)) return true;
+
+  // 3. 引用中还含作者、期刊等信息，按标题词数在查询上滑动窗口，逐段比较
+  const titleTokens = normTitle.split(' ').map(stemWord);
+  const queryTokens = normQuery.split(' ').map(stemWord);
+  const size = titleTokens.length;
+  const lastStart = Math.max(0, queryTokens.length - size);
+
+  if (size < SHORT_TITLE_WORDS) {
+    for (let i = 0; i <= lastStart; i++) {
+      if (matchesShortTitle(titleTokens, queryTokens.slice(i, i + size))) return true;
+    }
+    return false;
+  }
+
+  const titleGrams = charTrigrams(titleTokens.join(' '));
+
+  // 任一窗口的 3-gram 都包含在整条查询中，标题与整条查询共有的 3-gram 数因此是 Jaccard 分子的上界；
+  // 上界不足阈值时不必逐窗口计算
+  const queryGrams = charTrigrams(queryTokens.join(' '));
+  let sharedGrams = 0;
+  for (const gram of titleGrams) {
+    if (queryGrams.has(gram)) sharedGrams++;
+  }
+  if (sharedGrams < SIMILARITY_THRESHOLD * titleGrams.size) return false;
+
+  for (let i = 0; i <= lastStart; i++) {
+    const windowText = queryTokens.slice(i, i + size).join(' ');
+    if (jaccard(titleGrams, charTrigrams(windowText)) >= SIMILARITY_THRESHOLD) return true;
+  }
+
+  return false;
+};
+
+/**
+ * 单次扫描拆分引用列表，同时完成去空行、去序号和去首尾空白
+ * @param {string} text - 用户粘贴的整段引用
+ * @returns {{original: string, query: string}[]}
+ */
+const parseReferences = (text) => {
+  const references = [];
+  for (const match of text.matchAll(CITATION_LINE_RE)) {
+    references.push({ original: match[0], query: match[2] });
+  }
+  return references;
+};
+
+// OpenAlex API
+const checkOpenAlex = memoize(async (query, signal) => {
+  try {
+    const res = await retryFetch(buildApiUrl('https://api.openalex.org/works', {
+      search: query,
+      'per-page': 1,
+      select: OPENALEX_FIELDS
+    }), { signal }, openAlexLimiter);
+    if (res.status === 404) return { found: false, sourceName: 'OpenAlex' };
+    if (!res.ok) throw new Error('API Error');
+    const data = await res.json();
+    if (data.results && data.results.length > 0) {
+      const item = data.results[0];
+      const isMatch = checkSimilarity(query, item.display_name);
+      return {
+        found: true,
+        match: isMatch,
+        title: item.display_name,
+        year: item.publication_year,
+        url: item.doi,
+        sourceName: 'OpenAlex'
+      };
+    }
+    return { found: false, sourceName: 'OpenAlex' };
+  } catch (e) {
+    if (e.name === 'AbortError') throw e;
+    return { error: true, sourceName: 'OpenAlex' };
+  }
+}, { keyFn: q => 'OpenAlex:' + normalizeKey(q), shouldCache: isCacheable });
+
+// CrossRef API (替代 Semantic Scholar)
+const checkCrossRef = memoize(async (query, signal) => {
+  try {
+    // CrossRef 的 bibliographic 查询非常适合这种非结构化引用
+    const res = await retryFetch(buildApiUrl('https://api.crossref.org/works', {
+      'query.bibliographic': query,
+      rows: 1,
+      select: CROSSREF_FIELDS
+    }), { signal }, crossRefLimiter);
+    if (res.status === 404) return { found: false, sourceName: 'CrossRef' };
+    if (!res.ok) throw new Error('API Error');
+    const data = await res.json();
+
+    if (data.message && data.message.items && data.message.items.length > 0) {
+      const item = data.message.items[0];
+      // CrossRef 标题可能是数组
+      const title = item.title ? item.title[0] : '';
+      const year = item.created ? item.created['date-parts'][0][0] : '';
+      const isMatch = checkSimilarity(query, title);
+
+      return {
+        found: true,
+        match: isMatch,
+        title: title,
+        year: year,
+        url: item.URL, // CrossRef 通常直接返回 DOI URL
+        sourceName: 'CrossRef'
+      };
+    }
+    return { found: false, sourceName: 'CrossRef' };
+  } catch (e) {
+    if (e.name === 'AbortError') throw e;
+    return { error: true, sourceName: 'CrossRef' };
+  }
+}, { keyFn: q => 'CrossRef:' + normalizeKey(q), shouldCache: isCacheable });
+
+/**
+ * 核对单条引用：并行查询两个数据库并综合判断状态
+ * @param {{original: string, query: string}} reference - 解析后的一条引用
+ * @param {AbortSignal} signal - 核对被取消时中止请求
+ * @param {boolean} fastMode - 快速模式：OpenAlex 已验证时跳过 CrossRef
+ */
+const checkLine = async ({ original, query }, signal, fastMode) => {
+  let oaResult;
+  let crResult;
+  if (fastMode) {
+    // 先查 OpenAlex，已确认匹配则不再请求 CrossRef
+    oaResult = await checkOpenAlex(query, signal);
+    crResult = oaResult.match
+      ? { skipped: true, sourceName: 'CrossRef' }
+      : await checkCrossRef(query, signal);
+  } else {
+    // 并行请求 OpenAlex 和 CrossRef
+    [oaResult, crResult] = await Promise.all([
+      checkOpenAlex(query, signal),
+      checkCrossRef(query, signal)
+    ]);
+  }
+
+  // 综合判断状态
+  let status = 'not_found';
+  let message = '未找到匹配';
+
+  // 只要有一个数据库判定为高度匹配(verified)，就算通过
+  if (oaResult.match || crResult.match) {
+    status = 'verified';
+    message = '验证通过';
+  }
+  // 如果两个都找到了但都不匹配
+  else if (oaResult.found || crResult.found) {
+    status = 'suspicious';
+    message = '标题差异较大';
+  }
+
+  return {
+    original: original,
+    query: query,
+    status: status,
+    message: message,
+    sources: {
+      openAlex: oaResult,
+      crossRef: crResult // 更改为 CrossRef
+    }
+  };
+};
+
+// 当前核对任务的中止控制器
+let runController = null;
+
+self.onmessage = async ({ data }) => {
+  // 新的核对或取消请求都会中止上一次核对，丢弃其进行中的请求
+  if (runController) {
+    runController.abort();
+    runController = null;
+    inFlight.clear();
+  }
+  if (data.type !== 'check') return;
+
+  const controller = new AbortController();
+  runController = controller;
+  const { signal } = controller;
+
+  cache = new Map(data.cache);
+  const { runId, fastMode } = data;
+  const references = parseReferences(data.text);
+  const total = references.length;
+  let processed = 0;
+  self.postMessage({ type: 'start', runId, total });
+
+  const tasks = references.map((reference, index) => async () => {
+    if (signal.aborted) return;
+    try {
+      const result = await checkLine(reference, signal, fastMode);
+      processed++;
+      self.postMessage({ type: 'result', runId, index, result, processed, total });
+    } catch (e) {
+      // 已中止的核对不再回传结果
+      if (e.name !== 'AbortError') throw e;
+    }
+  });
+
+  // 多行并发核对，速率由各主机的令牌桶控制
+  await runPool(tasks, LINE_CONCURRENCY);
+  if (!signal.aborted) {
+    runController = null;
+    self.postMessage({ type: 'done', runId });
+  }
+};